@@ -1,19 +1,39 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any, Callable, Literal, Optional, Tuple
+import functools
 import math
+import time
 import numpy as np
+import orjson
 from datetime import datetime
-from sklearn.metrics.pairwise import cosine_similarity
 import os
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the feature kernel then runs as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+# Standard question order for consistent vectorization.
+# These IDs must match the frontend question_ids.
+QUESTION_ORDER = (
+    "ack_1", "ack_2", "ack_3",
+    "bp_1", "bp_2", "bp_3",
+    "gd_1", "gd_2", "gd_3",
+    "rc_1", "rc_2", "rc_3",
+)
+
 
 class Answer(BaseModel):
-    question_id: str
-    option_value: int  # numeric representation of chosen option (0,1,2,...)
+    # Only the questionnaire's own question IDs can be stored in the packed answer rows
+    question_id: Literal[QUESTION_ORDER]
+    # numeric representation of chosen option (0,1,2,3), matching the frontend radio values
+    option_value: int = Field(ge=0, le=3)
 
 
 class ParticipantSubmission(BaseModel):
@@ -22,7 +42,7 @@ class ParticipantSubmission(BaseModel):
     participant_name: Optional[str] = None  # Optional name for display
 
 
-app = FastAPI(title="Mental Well-being Agent")
+app = FastAPI(title="Mental Well-being Agent", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -33,10 +53,224 @@ app.add_middleware(
 )
 
 
+# Question IDs per theme; themes follow the rows of the packed (theme, question) grid
+THEME_KEYS = {
+    "ack": QUESTION_ORDER[0:3],   # Acknowledgement
+    "bp": QUESTION_ORDER[3:6],    # Boundaries & Priorities
+    "gd": QUESTION_ORDER[6:9],    # Growth & Direction
+    "rc": QUESTION_ORDER[9:12],   # Relationships & Communication
+}
+QUESTIONS_PER_THEME = len(THEME_KEYS["ack"])
+
+# Profile dimensions reported by generate_profile, in output order
+PROFILE_DIMENSIONS = (
+    "emotional_clarity",
+    "stress_management",
+    "growth_mindset",
+    "boundaries",
+    "relationship_safety",
+)
+
+# Summary sentence per profile dimension, indexed by score bucket:
+# 0 = low (<= 0.3), 1 = mid (no sentence), 2 = high (>= 0.7)
+SUMMARY_TABLE: Dict[str, Tuple[str, None, str]] = {
+    "emotional_clarity": (
+        "You may be in a phase where your inner world feels unclear or heavy.",
+        None,
+        "You show strong emotional awareness and reflection.",
+    ),
+    "stress_management": (
+        "Stress may be building up in ways that are hard to manage sustainably.",
+        None,
+        "You tend to recognize patterns in your stress and have some strategies to cope.",
+    ),
+    "growth_mindset": (
+        "You might be feeling a bit stuck or unsure about your direction right now.",
+        None,
+        "You seem to be growing a lot through self-reflection and change.",
+    ),
+    "boundaries": (
+        "There may be opportunities to set gentler boundaries for yourself.",
+        None,
+        "You are actively thinking about protecting your time, energy, and peace.",
+    ),
+    "relationship_safety": (
+        "You may be craving deeper understanding and safety in relationships.",
+        None,
+        "Safe and supportive connections seem important and present in your life.",
+    ),
+}
+
+# Length of the vectors produced by build_ai_feature_vector:
+# 12 raw answers + 4 themes × (mean, std) + 6 pattern features
+FEATURE_DIM = 26
+
+# Weight of the exact match ratio in the combined similarity, indexed by whether
+# the exact ratio is already high (>= 0.9); the AI similarity gets the remainder
+EXACT_MATCH_WEIGHTS = (0.4, 0.6)
+
+# Initial number of participant rows preallocated by ParticipantStore
+INITIAL_CAPACITY = 256
+
+
+def format_timestamp(timestamp_ns: int) -> str:
+    """ISO 8601 local time for an epoch timestamp in nanoseconds."""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000).isoformat()
+
+
+def serialize_snapshot(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-ready view of a stored snapshot, with its timestamp formatted."""
+    return {
+        "participant_id": snapshot["participant_id"],
+        "participant_name": snapshot["participant_name"],
+        "answers": snapshot["answers"],
+        "profile": snapshot["profile"],
+        "timestamp": format_timestamp(snapshot["timestamp_ns"]),
+    }
+
+
+def grow_rows(matrix: np.ndarray) -> np.ndarray:
+    """
+    Return a copy of the buffer with twice as many rows (amortised O(1) appends).
+    """
+    grown = np.empty((max(1, 2 * matrix.shape[0]), matrix.shape[1]), dtype=matrix.dtype)
+    grown[: matrix.shape[0]] = matrix
+    return grown
+
+
+class ParticipantStore:
+    """
+    Column-oriented (structure-of-arrays) in-memory participant store.
+    Row i of every column belongs to the same participant. Rows follow first
+    submission order, and a resubmission overwrites its row in place.
+    Packed answers and feature vectors live in growable numpy buffers so
+    similarity scans can run as whole-matrix operations.
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.answers: List[Dict[str, int]] = []
+        self.profiles: List[Dict[str, Any]] = []
+        self.timestamps_ns: List[int] = []  # epoch nanoseconds, formatted on output
+        self.id_to_idx: Dict[str, int] = {}
+        self._answer_matrix = np.empty((capacity, len(QUESTION_ORDER)), dtype=np.int8)
+        self._answered_matrix = np.empty((capacity, len(QUESTION_ORDER)), dtype=np.bool_)
+        self._feature_matrix = np.empty((capacity, FEATURE_DIM), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, participant_id: str) -> bool:
+        return participant_id in self.id_to_idx
+
+    @property
+    def answer_matrix(self) -> np.ndarray:
+        """(N, 12) int8 view of the packed answers in use."""
+        return self._answer_matrix[: len(self.ids)]
+
+    @property
+    def answered_matrix(self) -> np.ndarray:
+        """(N, 12) bool view marking which questions each participant answered."""
+        return self._answered_matrix[: len(self.ids)]
+
+    @property
+    def feature_matrix(self) -> np.ndarray:
+        """(N, 26) float32 view of the L2-normalised feature vectors in use."""
+        return self._feature_matrix[: len(self.ids)]
+
+    def upsert(
+        self,
+        participant_id: str,
+        name: str,
+        answers: Dict[str, int],
+        profile: Dict[str, Any],
+        timestamp_ns: int,
+        packed_answers: np.ndarray,
+        answered: np.ndarray,
+        features: np.ndarray,
+    ) -> int:
+        """
+        Store a participant's submission, appending a row for new participants
+        and overwriting it on resubmission. Returns the participant's row index.
+        """
+        idx = self.id_to_idx.get(participant_id)
+        if idx is None:
+            idx = len(self.ids)
+            if idx == self._feature_matrix.shape[0]:
+                self._answer_matrix = grow_rows(self._answer_matrix)
+                self._answered_matrix = grow_rows(self._answered_matrix)
+                self._feature_matrix = grow_rows(self._feature_matrix)
+            self.id_to_idx[participant_id] = idx
+            self.ids.append(participant_id)
+            self.names.append(name)
+            self.answers.append(answers)
+            self.profiles.append(profile)
+            self.timestamps_ns.append(timestamp_ns)
+        else:
+            self.names[idx] = name
+            self.answers[idx] = answers
+            self.profiles[idx] = profile
+            self.timestamps_ns[idx] = timestamp_ns
+        self._answer_matrix[idx] = packed_answers
+        self._answered_matrix[idx] = answered
+        self._feature_matrix[idx] = features
+        return idx
+
+    def record(self, idx: int) -> Dict[str, Any]:
+        """JSON-ready dict for the participant at row idx, built from the columns."""
+        return {
+            "id": self.ids[idx],
+            "name": self.names[idx],
+            "answers": self.answers[idx],
+            "profile": self.profiles[idx],
+            "timestamp": format_timestamp(self.timestamps_ns[idx]),
+        }
+
+    def records(self) -> Dict[str, Dict[str, Any]]:
+        """All participants as participant_id -> record, in row order."""
+        return {pid: self.record(idx) for idx, pid in enumerate(self.ids)}
+
+    def clear(self) -> None:
+        """Drop all participants. The matrix buffers keep their capacity."""
+        self.ids.clear()
+        self.names.clear()
+        self.answers.clear()
+        self.profiles.clear()
+        self.timestamps_ns.clear()
+        self.id_to_idx.clear()
+
+
 # In-memory store for demo purposes
-participants: Dict[str, Dict[str, Any]] = {}
+store = ParticipantStore()
 profile_snapshots: List[Dict[str, Any]] = []  # Store all profile snapshots with timestamps
 
+# Serialized JSON bodies of the read-only listing endpoints, keyed by endpoint.
+# Only /api/submit and /api/reset change the data, and both invalidate it.
+response_cache: Dict[str, bytes] = {}
+state_version = 0  # Bumped on every write so in-flight builds of stale data aren't cached
+
+
+def invalidate_response_cache() -> None:
+    """Drop cached responses after participants or snapshots change."""
+    global state_version
+    state_version += 1
+    response_cache.clear()
+
+
+def cached_json_response(key: str, build: Callable[[], Dict[str, Any]]) -> Response:
+    """
+    Serve the cached JSON body for `key`, building and caching it with orjson if missing.
+    """
+    body = response_cache.get(key)
+    if body is None:
+        version = state_version
+        body = orjson.dumps(build())
+        if version == state_version:
+            response_cache[key] = body
+    return Response(content=body, media_type="application/json")
+
 
 def build_answer_vector(answers: List[Answer]) -> Dict[str, int]:
     """
@@ -46,6 +280,98 @@ def build_answer_vector(answers: List[Answer]) -> Dict[str, int]:
     return {a.question_id: a.option_value for a in answers}
 
 
+def pack_answers(answer_vector: Dict[str, int]) -> np.ndarray:
+    """
+    Pack an answer dict into a fixed 12-slot int8 array in QUESTION_ORDER.
+    Unanswered questions are stored as 0.
+    """
+    return np.array([answer_vector.get(qid, 0) for qid in QUESTION_ORDER], dtype=np.int8)
+
+
+def answered_mask(answer_vector: Dict[str, int]) -> np.ndarray:
+    """
+    Which of the QUESTION_ORDER slots were actually answered (vs packed as 0).
+    """
+    return np.array([qid in answer_vector for qid in QUESTION_ORDER], dtype=np.bool_)
+
+
+@njit(cache=True, fastmath=True)
+def _build_features(answers, answered):
+    """
+    Compiled kernel behind build_ai_feature_vector.
+    Takes the packed int8[12] answers plus their bool[12] answered mask and
+    returns the L2-normalised float32[26] feature vector.
+    """
+    features = np.zeros(FEATURE_DIM, dtype=np.float32)
+    n = answers.shape[0]
+
+    # Base features (raw answer values, 0 if unanswered) plus running totals
+    # over the answered questions for the pattern features
+    count = 0
+    total = 0.0
+    peak = 0.0
+    trough = 0.0
+    high = 0
+    low = 0
+    for i in range(n):
+        value = float(answers[i])
+        features[i] = value
+        if not answered[i]:
+            continue
+        if count == 0:
+            peak = value
+            trough = value
+        count += 1
+        total += value
+        peak = max(peak, value)
+        trough = min(trough, value)
+        if value >= 2:
+            high += 1
+        if value <= 1:
+            low += 1
+
+    # Thematic features: (mean, std) per category of 3 questions
+    for theme in range(4):
+        start = theme * 3
+        theme_mean = (features[start] + features[start + 1] + features[start + 2]) / 3.0
+        theme_var = 0.0
+        for k in range(3):
+            diff = features[start + k] - theme_mean
+            theme_var += diff * diff
+        features[n + 2 * theme] = theme_mean
+        features[n + 2 * theme + 1] = math.sqrt(theme_var / 3.0)
+
+    # Pattern features: response intensity and distribution (all 0 if nothing answered)
+    if count > 0:
+        mean = total / count
+        var = 0.0
+        for i in range(n):
+            if answered[i]:
+                diff = features[i] - mean
+                var += diff * diff
+        offset = n + 8
+        features[offset] = mean                         # Average response intensity
+        features[offset + 1] = math.sqrt(var / count)   # Response variability
+        features[offset + 2] = peak                     # Peak intensity
+        features[offset + 3] = trough                   # Minimum intensity
+        features[offset + 4] = high / count             # High-intensity ratio
+        features[offset + 5] = low / count              # Low-intensity ratio
+
+    # Normalize to prevent scale bias
+    norm_sq = 0.0
+    for i in range(FEATURE_DIM):
+        norm_sq += features[i] * features[i]
+    norm = math.sqrt(norm_sq)
+    if norm > 1e-10:  # Use epsilon instead of 0 to handle floating point precision
+        for i in range(FEATURE_DIM):
+            features[i] /= norm
+    else:
+        # If norm is zero (all answers are 0), return zero vector
+        features[:] = 0.0
+
+    return features
+
+
 def build_ai_feature_vector(answer_vector: Dict[str, int]) -> np.ndarray:
     """
     Convert answer vector into an AI feature vector for semantic similarity.
@@ -54,65 +380,104 @@ def build_ai_feature_vector(answer_vector: Dict[str, int]) -> np.ndarray:
     - Thematic patterns (emotional, boundaries, growth, relationships)
     - Response intensity patterns
     - Overall response distribution
-    """
-    # Standard question order for consistent vectorization
-    question_order = [
-        "ack_1", "ack_2", "ack_3",
-        "bp_1", "bp_2", "bp_3",
-        "gd_1", "gd_2", "gd_3",
-        "rc_1", "rc_2", "rc_3"
-    ]
-    
-    # Base features: raw answer values
-    base_features = [answer_vector.get(qid, 0) for qid in question_order]
-    
-    # Thematic features: aggregate by category
-    ack_values = [answer_vector.get(f"ack_{i}", 0) for i in [1, 2, 3]]
-    bp_values = [answer_vector.get(f"bp_{i}", 0) for i in [1, 2, 3]]
-    gd_values = [answer_vector.get(f"gd_{i}", 0) for i in [1, 2, 3]]
-    rc_values = [answer_vector.get(f"rc_{i}", 0) for i in [1, 2, 3]]
     
-    # Helper function to safely compute std (returns 0 if all values are same)
-    def safe_std(values):
-        if len(values) <= 1:
-            return 0.0
-        std_val = np.std(values)
-        return std_val if not np.isnan(std_val) else 0.0
-    
-    thematic_features = [
-        np.mean(ack_values) if ack_values else 0.0, safe_std(ack_values),  # Acknowledgement stats
-        np.mean(bp_values) if bp_values else 0.0, safe_std(bp_values),    # Boundaries stats
-        np.mean(gd_values) if gd_values else 0.0, safe_std(gd_values),    # Growth stats
-        np.mean(rc_values) if rc_values else 0.0, safe_std(rc_values),    # Relationships stats
-    ]
-    
-    # Pattern features: response intensity and distribution
-    all_values = list(answer_vector.values())
-    pattern_features = [
-        np.mean(all_values) if all_values else 0.0,           # Average response intensity
-        safe_std(all_values),                                  # Response variability
-        np.max(all_values) if all_values else 0.0,            # Peak intensity
-        np.min(all_values) if all_values else 0.0,            # Minimum intensity
-        len([v for v in all_values if v >= 2]) / len(all_values) if all_values else 0,  # High-intensity ratio
-        len([v for v in all_values if v <= 1]) / len(all_values) if all_values else 0,  # Low-intensity ratio
-    ]
-    
-    # Combine all features into a single vector
-    feature_vector = np.array(base_features + thematic_features + pattern_features, dtype=np.float64)
-    
-    # Normalize to prevent scale bias
-    # Use a small epsilon to avoid division by zero
-    norm = np.linalg.norm(feature_vector)
-    if norm > 1e-10:  # Use epsilon instead of 0 to handle floating point precision
-        feature_vector = feature_vector / norm
-    else:
-        # If norm is zero (all answers are 0), return zero vector
-        feature_vector = np.zeros_like(feature_vector)
+    Results are memoised on the answers, so repeated identical submissions
+    skip the vector construction entirely. The returned array is read-only.
+    """
+    return build_ai_feature_vector_from_packed(
+        pack_answers(answer_vector), answered_mask(answer_vector)
+    )
+
+
+def build_ai_feature_vector_from_packed(packed_answers: np.ndarray, answered: np.ndarray) -> np.ndarray:
+    """
+    build_ai_feature_vector for answers already packed with pack_answers / answered_mask.
+    """
+    return _cached_feature_vector(packed_answers.tobytes(), answered.tobytes())
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_feature_vector(answers_key: bytes, answered_key: bytes) -> np.ndarray:
+    features = _build_features(
+        np.frombuffer(answers_key, dtype=np.int8), np.frombuffer(answered_key, dtype=np.bool_)
+    )
+    # Shared between callers through the cache, so guard against in-place edits
+    features.setflags(write=False)
+    return features
+
+
+def exact_match_ratio(vec_a: Dict[str, int], vec_b: Dict[str, int]) -> float:
+    """
+    Fraction of shared questions on which both participants chose the same option.
+    """
+    shared_questions = set(vec_a.keys()) & set(vec_b.keys())
+    if not shared_questions:
+        return 0.0
+    exact_matches = sum(1 for q in shared_questions if vec_a[q] == vec_b[q])
+    return exact_matches / len(shared_questions)
+
+
+def exact_match_ratios(
+    answers_a: np.ndarray,
+    answered_a: np.ndarray,
+    answers_b: np.ndarray,
+    answered_b: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorised exact_match_ratio over packed answer rows (broadcasting like ==).
+    Only questions answered on both sides count; rows sharing none score 0.
+    """
+    shared = answered_a & answered_b
+    shared_counts = shared.sum(axis=1)
+    matches = ((answers_a == answers_b) & shared).sum(axis=1)
+    return np.divide(
+        matches, shared_counts, out=np.zeros(shared_counts.shape), where=shared_counts > 0
+    )
+
+
+def combine_similarity(ai_similarity: float, exact_ratio: float) -> float:
+    """
+    Blend the AI (cosine) similarity with the exact match ratio into a final 0–1 score.
+    """
+    # If all answers are identical, return 1.0 (perfect match)
+    if exact_ratio >= 1.0:
+        return 1.0
+
+    # Handle NaN or invalid cosine similarity
+    if np.isnan(ai_similarity) or ai_similarity < 0:
+        ai_similarity = exact_ratio
+
+    # Combine AI similarity with exact matches
+    # For high exact matches, weight exact ratio more heavily; the weight is
+    # picked by indexing rather than branching
+    exact_weight = EXACT_MATCH_WEIGHTS[exact_ratio >= 0.9]
+    combined_similarity = (exact_ratio * exact_weight) + (ai_similarity * (1 - exact_weight))
     
-    return feature_vector
+    # Ensure result is between 0 and 1
+    return max(0.0, min(1.0, combined_similarity))
 
 
-def compute_similarity(vec_a: Dict[str, int], vec_b: Dict[str, int]) -> float:
+def combine_similarities(ai_similarities: np.ndarray, exact_ratios: np.ndarray) -> np.ndarray:
+    """
+    Vectorised combine_similarity: blends arrays of AI similarities and exact match ratios.
+    """
+    # Handle NaN or invalid cosine similarity
+    ai_similarities = np.where(
+        np.isnan(ai_similarities) | (ai_similarities < 0), exact_ratios, ai_similarities
+    )
+    exact_weights = np.where(exact_ratios >= 0.9, EXACT_MATCH_WEIGHTS[1], EXACT_MATCH_WEIGHTS[0])
+    combined = (exact_ratios * exact_weights) + (ai_similarities * (1 - exact_weights))
+    # If all answers are identical, return 1.0 (perfect match)
+    combined = np.where(exact_ratios >= 1.0, 1.0, combined)
+    return np.clip(combined, 0.0, 1.0)
+
+
+def compute_similarity(
+    vec_a: Dict[str, int],
+    vec_b: Dict[str, int],
+    features_a: Optional[np.ndarray] = None,
+    features_b: Optional[np.ndarray] = None,
+) -> float:
     """
     AI-based similarity using cosine similarity on multi-dimensional feature vectors.
     This captures semantic patterns beyond exact matches, including:
@@ -120,62 +485,45 @@ def compute_similarity(vec_a: Dict[str, int], vec_b: Dict[str, int]) -> float:
     - Response intensity patterns
     - Overall mental health profile similarity
     
+    Precomputed feature vectors (from build_ai_feature_vector) can be passed in
+    via features_a / features_b to avoid rebuilding them on every comparison.
+    
     Returns a score between 0 and 1, where 1.0 = identical patterns.
     """
     if not vec_a or not vec_b:
         return 0.0
 
+    # Identical answer dicts are a perfect match; skip all further work
+    if vec_a == vec_b:
+        return 1.0
+
     # First check exact match ratio - if 100% identical, return 1.0 immediately
-    shared_questions = set(vec_a.keys()) & set(vec_b.keys())
-    if shared_questions:
-        exact_matches = sum(1 for q in shared_questions if vec_a[q] == vec_b[q])
-        exact_ratio = exact_matches / len(shared_questions)
-        
-        # If all answers are identical, return 1.0 (perfect match)
-        if exact_ratio >= 1.0:
-            return 1.0
-    else:
-        exact_ratio = 0.0
+    exact_ratio = exact_match_ratio(vec_a, vec_b)
+    if exact_ratio >= 1.0:
+        return 1.0
 
     # Build AI feature vectors for semantic similarity
     try:
-        features_a = build_ai_feature_vector(vec_a)
-        features_b = build_ai_feature_vector(vec_b)
+        if features_a is None:
+            features_a = build_ai_feature_vector(vec_a)
+        if features_b is None:
+            features_b = build_ai_feature_vector(vec_b)
         
         # Check for NaN or invalid values
         if np.any(np.isnan(features_a)) or np.any(np.isnan(features_b)):
             # Fall back to exact match ratio if feature vectors are invalid
             return exact_ratio
         
-        # Compute cosine similarity (AI-based semantic similarity)
-        similarity_matrix = cosine_similarity(
-            features_a.reshape(1, -1),
-            features_b.reshape(1, -1)
-        )
-        ai_similarity = float(similarity_matrix[0][0])
-        
-        # Handle NaN or invalid cosine similarity
-        if np.isnan(ai_similarity) or ai_similarity < 0:
-            ai_similarity = exact_ratio
+        # Compute cosine similarity (AI-based semantic similarity).
+        # Feature vectors are already L2-normalised, so a dot product suffices.
+        ai_similarity = float(np.dot(features_a, features_b))
         
     except Exception as e:
         # If AI computation fails, fall back to exact matching
         print(f"Warning: AI similarity computation failed, using exact match: {e}")
         return exact_ratio
     
-    # Combine AI similarity with exact matches
-    # For high exact matches, weight exact ratio more heavily
-    if exact_ratio >= 0.9:
-        # If exact match is already high, trust it more
-        combined_similarity = (exact_ratio * 0.6) + (ai_similarity * 0.4)
-    else:
-        # Otherwise, use balanced weighting
-        combined_similarity = (ai_similarity * 0.6) + (exact_ratio * 0.4)
-    
-    # Ensure result is between 0 and 1
-    final_similarity = max(0.0, min(1.0, combined_similarity))
-    
-    return final_similarity
+    return combine_similarity(ai_similarity, exact_ratio)
 
 
 def generate_profile(answer_vector: Dict[str, int]) -> Dict[str, Any]:
@@ -184,64 +532,33 @@ def generate_profile(answer_vector: Dict[str, int]) -> Dict[str, Any]:
     Maps responses to scores across a few dimensions and returns a summary.
     This can be made more sophisticated later.
     """
-    # Initialize dimensions
-    dimensions = {
-        "emotional_clarity": 0,
-        "stress_management": 0,
-        "growth_mindset": 0,
-        "boundaries": 0,
-        "relationship_safety": 0,
-    }
+    return generate_profile_from_packed(pack_answers(answer_vector))
 
-    # Example: tie some question IDs to certain dimensions.
-    # These IDs must match the frontend question_ids.
-    for qid, value in answer_vector.items():
-        # Acknowledgement
-        if qid in {"ack_1", "ack_2", "ack_3"}:
-            dimensions["emotional_clarity"] += value
-        # Boundaries & Priorities
-        if qid in {"bp_1", "bp_2", "bp_3"}:
-            dimensions["boundaries"] += value
-            dimensions["stress_management"] += value
-        # Growth & Direction
-        if qid in {"gd_1", "gd_2", "gd_3"}:
-            dimensions["growth_mindset"] += value
-        # Relationships & Communication
-        if qid in {"rc_1", "rc_2", "rc_3"}:
-            dimensions["relationship_safety"] += value
+
+def generate_profile_from_packed(packed_answers: np.ndarray) -> Dict[str, Any]:
+    """
+    generate_profile for answers already packed with pack_answers.
+    """
+    # Sum answers per theme (rows ordered as THEME_KEYS) in one reduction
+    # over the packed (theme, question) grid
+    theme_totals = packed_answers.reshape(len(THEME_KEYS), QUESTIONS_PER_THEME).sum(
+        axis=1, dtype=np.int32
+    )
+    ack_total, bp_total, gd_total, rc_total = theme_totals
 
     # Normalise scores into 0–1 range assuming options 0–3 and up to 3 questions per theme
     max_per_question = 3
-    max_questions_per_dim = 3
+    max_questions_per_dim = QUESTIONS_PER_THEME
     max_score = max_per_question * max_questions_per_dim
 
-    normalized = {k: (v / max_score) if max_score else 0.0 for k, v in dimensions.items()}
-
-    summary_parts = []
-    if normalized["emotional_clarity"] >= 0.7:
-        summary_parts.append("You show strong emotional awareness and reflection.")
-    elif normalized["emotional_clarity"] <= 0.3:
-        summary_parts.append("You may be in a phase where your inner world feels unclear or heavy.")
+    # Boundaries answers feed both stress management and boundaries
+    scores = np.array([ack_total, bp_total, gd_total, bp_total, rc_total]) / max_score
+    normalized = dict(zip(PROFILE_DIMENSIONS, scores.tolist()))
 
-    if normalized["stress_management"] >= 0.7:
-        summary_parts.append("You tend to recognize patterns in your stress and have some strategies to cope.")
-    elif normalized["stress_management"] <= 0.3:
-        summary_parts.append("Stress may be building up in ways that are hard to manage sustainably.")
-
-    if normalized["growth_mindset"] >= 0.7:
-        summary_parts.append("You seem to be growing a lot through self-reflection and change.")
-    elif normalized["growth_mindset"] <= 0.3:
-        summary_parts.append("You might be feeling a bit stuck or unsure about your direction right now.")
-
-    if normalized["boundaries"] >= 0.7:
-        summary_parts.append("You are actively thinking about protecting your time, energy, and peace.")
-    elif normalized["boundaries"] <= 0.3:
-        summary_parts.append("There may be opportunities to set gentler boundaries for yourself.")
-
-    if normalized["relationship_safety"] >= 0.7:
-        summary_parts.append("Safe and supportive connections seem important and present in your life.")
-    elif normalized["relationship_safety"] <= 0.3:
-        summary_parts.append("You may be craving deeper understanding and safety in relationships.")
+    # Bucket each score as 0 = low (<= 0.3), 1 = mid, 2 = high (>= 0.7) and look up its text
+    buckets = 1 + (scores >= 0.7).astype(np.int8) - (scores <= 0.3).astype(np.int8)
+    texts = (SUMMARY_TABLE[dim][bucket] for dim, bucket in zip(PROFILE_DIMENSIONS, buckets))
+    summary_parts = [text for text in texts if text is not None]
 
     if not summary_parts:
         summary_parts.append(
@@ -261,122 +578,176 @@ def submit_responses(payload: ParticipantSubmission):
     and return the profile along with any highly similar participants (>= 0.9).
     Uses AI-based evaluation for similarity detection.
     """
+    timestamp_ns = time.time_ns()
     answer_vector = build_answer_vector(payload.answers)
-    profile = generate_profile(answer_vector)
+    # Pack the answers once; the profile, features, store and comparisons all reuse them
+    packed_answers = pack_answers(answer_vector)
+    answered = answered_mask(answer_vector)
+    profile = generate_profile_from_packed(packed_answers)
+    my_features = build_ai_feature_vector_from_packed(packed_answers, answered)
     
-    # Create profile snapshot with timestamp
+    # Create profile snapshot with timestamp (formatted only when serialized)
     snapshot = {
         "participant_id": payload.participant_id,
         "participant_name": payload.participant_name or payload.participant_id,
         "answers": answer_vector,
         "profile": profile,
-        "timestamp": datetime.now().isoformat(),
-        "ai_feature_vector": build_ai_feature_vector(answer_vector).tolist(),
+        "timestamp_ns": timestamp_ns,
     }
     
-    # Store in participants dict (for quick lookup)
-    participants[payload.participant_id] = {
-        "id": payload.participant_id,
-        "name": payload.participant_name or payload.participant_id,
-        "answers": answer_vector,
-        "profile": profile,
-        "timestamp": snapshot["timestamp"],
-    }
+    # Store in the participant store (for quick lookup and matrix scans)
+    my_row = store.upsert(
+        payload.participant_id,
+        payload.participant_name or payload.participant_id,
+        answer_vector,
+        profile,
+        timestamp_ns,
+        packed_answers,
+        answered,
+        my_features,
+    )
     
     # Store snapshot in history
     profile_snapshots.append(snapshot)
-
-    # AI-based similarity computation with existing participants
+    invalidate_response_cache()
+
+    # AI-based similarity computation with existing participants:
+    # one matrix-vector product and one row-wise comparison score the
+    # new participant against every row at once
+    ai_scores = store.feature_matrix @ my_features
+    exact_ratios = exact_match_ratios(
+        store.answer_matrix, store.answered_matrix, packed_answers, answered
+    )
+    scores = combine_similarities(ai_scores, exact_ratios)
     similarities = []
-    for other_id, other_data in participants.items():
-        if other_id == payload.participant_id:
+    for row in np.flatnonzero(scores >= 0.9):
+        if row == my_row or not answer_vector or not store.answers[row]:
             continue
-        score = compute_similarity(answer_vector, other_data["answers"])
-        
-        # Debug logging (can be removed in production)
-        print(f"Comparing {payload.participant_id} with {other_id}: similarity = {score:.4f} ({score*100:.2f}%)")
-        
-        if score >= 0.9:
-            similarities.append(
-                {
-                    "participant_id": other_id,
-                    "participant_name": other_data.get("name", other_id),
-                    "similarity": round(score, 4),
-                    "similarity_percentage": round(score * 100, 2),
-                }
-            )
+        score = float(scores[row])
+        similarities.append(
+            {
+                "participant_id": store.ids[row],
+                "participant_name": store.names[row],
+                "similarity": round(score, 4),
+                "similarity_percentage": round(score * 100, 2),
+            }
+        )
     
     # Sort by similarity (highest first)
     similarities.sort(key=lambda x: x["similarity"], reverse=True)
 
+    snapshot_data = serialize_snapshot(snapshot)
     return {
         "participant_id": payload.participant_id,
         "participant_name": payload.participant_name or payload.participant_id,
         "profile": profile,
-        "profile_snapshot": snapshot,
+        "profile_snapshot": snapshot_data,
         "highly_similar_participants": similarities,
         "has_similar_matches": len(similarities) > 0,
-        "submission_timestamp": snapshot["timestamp"],
+        "submission_timestamp": snapshot_data["timestamp"],
     }
 
 
-@app.get("/api/participants")
-def list_participants():
-    """
-    Return all stored participants, their profiles, and similarity pairs >= 0.9.
-    Useful for an overview after many submissions (e.g., 200–250 participants).
-    """
-    ids = list(participants.keys())
+def participants_overview() -> Dict[str, Any]:
+    """Build the /api/participants payload from the current store."""
+    count = len(store)
     similarity_pairs = []
 
-    for i in range(len(ids)):
-        for j in range(i + 1, len(ids)):
-            a = participants[ids[i]]
-            b = participants[ids[j]]
-            score = compute_similarity(a["answers"], b["answers"])
-            if score >= 0.9:
-                similarity_pairs.append(
-                    {
-                        "participant_a": a["id"],
-                        "participant_a_name": a.get("name", a["id"]),
-                        "participant_b": b["id"],
-                        "participant_b_name": b.get("name", b["id"]),
-                        "similarity": round(score, 4),
-                        "similarity_percentage": round(score * 100, 2),
-                    }
-                )
+    if count:
+        # Feature rows are unit length, so one matrix product gives the
+        # cosine similarity of every pair at once.
+        answers, answered, features = store.answer_matrix, store.answered_matrix, store.feature_matrix
+        ai_similarities = features @ features.T
+        rows, cols = np.triu_indices(count, 1)
+        exact_ratios = exact_match_ratios(answers[rows], answered[rows], answers[cols], answered[cols])
+        scores = combine_similarities(ai_similarities[rows, cols], exact_ratios)
+
+        for k in np.flatnonzero(scores >= 0.9):
+            i, j = rows[k], cols[k]
+            if not store.answers[i] or not store.answers[j]:
+                continue
+            score = float(scores[k])
+            similarity_pairs.append(
+                {
+                    "participant_a": store.ids[i],
+                    "participant_a_name": store.names[i],
+                    "participant_b": store.ids[j],
+                    "participant_b_name": store.names[j],
+                    "similarity": round(score, 4),
+                    "similarity_percentage": round(score * 100, 2),
+                }
+            )
 
     return {
-        "count": len(participants),
-        "participants": participants,
+        "count": count,
+        "participants": store.records(),
         "profile_snapshots_count": len(profile_snapshots),
         "highly_similar_pairs": similarity_pairs,
     }
 
 
+@app.get("/api/participants")
+def list_participants():
+    """
+    Return all stored participants, their profiles, and similarity pairs >= 0.9.
+    Useful for an overview after many submissions (e.g., 200–250 participants).
+    The serialized response is cached until the next submit or reset.
+    """
+    return cached_json_response("participants", participants_overview)
+
+
 @app.get("/api/snapshots")
 def get_snapshots():
     """Return all profile snapshots stored for future comparison."""
-    return {
-        "count": len(profile_snapshots),
-        "snapshots": profile_snapshots,
-    }
+    return cached_json_response(
+        "snapshots",
+        lambda: {
+            "count": len(profile_snapshots),
+            "snapshots": [serialize_snapshot(snapshot) for snapshot in profile_snapshots],
+        },
+    )
+
+
+@app.get("/api/snapshots/{idx}/features")
+def get_snapshot_features(idx: int):
+    """
+    Return the AI feature vector for one profile snapshot.
+    Snapshots only keep the raw answers, so the vector is rebuilt on request.
+    """
+    if not 0 <= idx < len(profile_snapshots):
+        return {"error": "Snapshot not found"}
+    
+    snapshot = profile_snapshots[idx]
+    # Returned directly so orjson serializes the ndarray itself (no .tolist() copy)
+    return ORJSONResponse({
+        "index": idx,
+        "participant_id": snapshot["participant_id"],
+        "timestamp": format_timestamp(snapshot["timestamp_ns"]),
+        "ai_feature_vector": build_ai_feature_vector(snapshot["answers"]),
+    })
 
 
 @app.get("/api/debug/similarity/{id1}/{id2}")
 def debug_similarity(id1: str, id2: str):
     """Debug endpoint to check similarity between two participants."""
-    if id1 not in participants or id2 not in participants:
+    if id1 not in store or id2 not in store:
         return {"error": "One or both participants not found"}
     
-    p1 = participants[id1]
-    p2 = participants[id2]
+    idx1 = store.id_to_idx[id1]
+    idx2 = store.id_to_idx[id2]
+    answers1 = store.answers[idx1]
+    answers2 = store.answers[idx2]
     
-    score = compute_similarity(p1["answers"], p2["answers"])
+    score = compute_similarity(
+        answers1,
+        answers2,
+        features_a=store.feature_matrix[idx1],
+        features_b=store.feature_matrix[idx2],
+    )
     
     # Also compute exact match details
-    shared_questions = set(p1["answers"].keys()) & set(p2["answers"].keys())
-    exact_matches = sum(1 for q in shared_questions if p1["answers"][q] == p2["answers"][q])
+    shared_questions = set(answers1.keys()) & set(answers2.keys())
+    exact_matches = sum(1 for q in shared_questions if answers1[q] == answers2[q])
     exact_ratio = exact_matches / len(shared_questions) if shared_questions else 0.0
     
     return {
@@ -395,44 +766,37 @@ def debug_similarity(id1: str, id2: str):
 @app.delete("/api/reset")
 def reset():
     """Clear all stored participants and snapshots (for testing/demo)."""
-    participants.clear()
+    store.clear()
     profile_snapshots.clear()
+    invalidate_response_cache()
     return {"status": "ok", "message": "All participants and snapshots cleared."}
 
 
 # Serve static files (frontend)
 static_dir = os.path.join(os.path.dirname(__file__), "static")
 if os.path.exists(static_dir):
-    app.mount("/static", StaticFiles(directory=static_dir), name="static")
+    app.mount("/static", StaticFiles(directory=static_dir, html=True), name="static")
+
+# The questionnaire page is read once at startup and served from memory
+# (restart the server to pick up changes to index.html)
+index_path = os.path.join(static_dir, "index.html")
+index_html: Optional[bytes] = None
+if os.path.exists(index_path):
+    with open(index_path, "rb") as index_file:
+        index_html = index_file.read()
 
 
 @app.get("/")
 async def read_root():
     """Serve the frontend index.html"""
-    index_path = os.path.join(static_dir, "index.html")
-    if os.path.exists(index_path):
-        return FileResponse(index_path)
+    if index_html is not None:
+        return Response(content=index_html, media_type="text/html")
     return {"message": "Frontend not found. Please ensure static/index.html exists."}
 
 
-if __name__ == "__main__":
-    import uvicorn
-    
-    # Get port from environment variable (for production deployments) or default to 8000
-    port = int(os.getenv("PORT", 8000))
-    # Disable reload in production (set RELOAD env var to enable)
-    reload = os.getenv("RELOAD", "false").lower() == "true"
-    
-    print(f"🚀 Starting Mental Well-being Agent server...")
-    print(f"📡 Server will be available at: http://0.0.0.0:{port}")
-    print(f"🌐 Access from other devices: http://{get_local_ip()}:{port}")
-    print(f"📱 Generate QR code: python generate_qr.py http://{get_local_ip()}:{port}")
-    
-    uvicorn.run("app:app", host="0.0.0.0", port=port, reload=reload)
-
-
+@functools.lru_cache(maxsize=1)
 def get_local_ip():
-    """Get the local IP address for QR code generation."""
+    """Get the local IP address for QR code generation (looked up once, then cached)."""
     import socket
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -444,3 +808,18 @@ def get_local_ip():
         return "localhost"
 
 
+if __name__ == "__main__":
+    import uvicorn
+    
+    # Get port from environment variable (for production deployments) or default to 8000
+    port = int(os.getenv("PORT", 8000))
+    # Disable reload in production (set RELOAD env var to enable)
+    reload = os.getenv("RELOAD", "false").lower() == "true"
+    
+    print(f"🚀 Starting Mental Well-being Agent server...")
+    print(f"📡 Server will be available at: http://0.0.0.0:{port}")
+    local_ip = get_local_ip()
+    print(f"🌐 Access from other devices: http://{local_ip}:{port}")
+    print(f"📱 Generate QR code: python generate_qr.py http://{local_ip}:{port}")
+    
+    uvicorn.run("app:app", host="0.0.0.0", port=port, reload=reload)